@@ -4,8 +4,6 @@ from __future__ import annotations
 
 import typing as t
 
-import boto3
-
 from .s3 import S3RepositoryBackend
 
 __all__ = ('AwsS3RepositoryBackend',)
@@ -28,8 +26,7 @@ class AwsS3RepositoryBackend(S3RepositoryBackend):
         """
         self._bucket_name = bucket_name
         self._region_name = region_name
-        self._client = boto3.client(
-            's3',
+        self._client = self._get_client(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region_name,
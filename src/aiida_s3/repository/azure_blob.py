@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
+import functools
 import tempfile
 import typing as t
 import uuid
 
 from aiida.repository.backend.abstract import AbstractRepositoryBackend
-from azure.storage.blob import BlobServiceClient, ContainerClient
+
+from .utils import batched, iter_prefetched, map_bounded
+
+if t.TYPE_CHECKING:
+    from azure.storage.blob import BlobServiceClient, ContainerClient
 
 __all__ = ('AzureBlobStorageRepositoryBackend',)
 
@@ -16,6 +22,24 @@ __all__ = ('AzureBlobStorageRepositoryBackend',)
 class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
     """Implementation of the ``AbstractRepositoryBackend`` using Azure Blob Storage as the backend."""
 
+    max_workers: t.ClassVar[int] = 32
+    """Maximum number of threads used to perform requests concurrently."""
+
+    has_objects_list_threshold: t.ClassVar[int] = 1000
+    """Number of keys above which ``has_objects`` lists the container instead of requesting each blob separately."""
+
+    delete_objects_batch_size: t.ClassVar[int] = 256
+    """Maximum number of blobs deleted per request, which is the limit imposed by the blob batch operation."""
+
+    max_prefetch: t.ClassVar[int] = 16
+    """Maximum number of objects downloaded ahead of the consumer by ``iter_object_streams``."""
+
+    spool_max_size: t.ClassVar[int] = 8 * 1024 * 1024
+    """Size in bytes up to which downloaded blobs are kept in memory before being spooled to disk."""
+
+    _container_verified: bool = False
+    """Whether the container is known to exist, in which case it is no longer checked with a request."""
+
     def __init__(self, container_name: str, connection_string: str):
         """Construct a new instance for a given storage account and container.
 
@@ -28,27 +52,48 @@ class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
         """
         self._container_name: str = container_name
         self._connection_string: str = connection_string
-
-        try:
-            self._service_client: BlobServiceClient = BlobServiceClient.from_connection_string(self._connection_string)
-        except ValueError as exception:
-            raise ValueError(
-                f'could not connect with the given connection string: {self._connection_string}'
-            ) from exception
-
-        if self._service_client is None:
-            raise ValueError(f'failed to connect with the given connection string: {self._connection_string}')
-
+        self._service_client: BlobServiceClient = self._get_service_client(self._connection_string)
         self._container_client: ContainerClient = self._service_client.get_container_client(self._container_name)
 
     def __str__(self) -> str:
         """Return the string representation of this repository."""
         return f'AwsS3RepositoryBackend: <{self._container_name}>'
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_service_client(connection_string: str) -> BlobServiceClient:
+        """Return a service client for the given connection string.
+
+        Clients are thread-safe, so a single client is created per connection string and shared by all instances that
+        use it. This avoids re-establishing connections each time a repository is constructed.
+
+        :param connection_string: The connection string for the Azure Blob Storage storage account.
+        :return: Instance of :class:`azure.storage.blob.BlobServiceClient`.
+        :raises ValueError: if no client could be created for the connection string.
+        """
+        from azure.storage.blob import BlobServiceClient
+
+        try:
+            service_client = BlobServiceClient.from_connection_string(connection_string)
+        except ValueError as exception:
+            raise ValueError(f'could not connect with the given connection string: {connection_string}') from exception
+
+        if service_client is None:
+            raise ValueError(f'failed to connect with the given connection string: {connection_string}')
+
+        return service_client
+
     @property
     def _container_exists(self) -> bool:
-        """Return whether the container exists."""
-        return self._container_client.exists()
+        """Return whether the container exists.
+
+        Once the container has been found to exist, this is remembered and no further requests are made until ``erase``
+        is called.
+        """
+        if not self._container_verified:
+            self._container_verified = self._container_client.exists()
+
+        return self._container_verified
 
     @property
     def is_initialised(self) -> bool:
@@ -68,6 +113,7 @@ class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
             return
 
         self._container_client.create_container(**kwargs)
+        self._container_verified = True
 
     @property
     def uuid(self) -> str:
@@ -85,6 +131,7 @@ class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
             return
 
         self._container_client.delete_container()
+        self._container_verified = False
 
     def _put_object_from_filelike(self, handle: t.BinaryIO) -> str:
         """Store the byte contents of a file in the repository.
@@ -104,8 +151,23 @@ class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
         :return: list of booleans, in the same order as the keys provided, with value True if the respective object
             exists and False otherwise.
         """
-        existing_keys = set(self.list_objects())
-        return [key in existing_keys for key in keys]
+        if len(keys) > self.has_objects_list_threshold:
+            existing_keys = set(self.list_objects())
+            return [key in existing_keys for key in keys]
+
+        if len(keys) <= 1:
+            return [self._has_object(key) for key in keys]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(keys))) as executor:
+            return list(executor.map(self._has_object, keys))
+
+    def _has_object(self, key: str) -> bool:
+        """Return whether the repository has an object with the given key.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :return: True if the object exists, False otherwise.
+        """
+        return self._container_client.get_blob_client(key).exists()
 
     @contextlib.contextmanager
     def open(self, key: str) -> t.Iterator[t.IO[bytes]]:  # type: ignore[override]
@@ -119,17 +181,39 @@ class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
         :raise FileNotFoundError: if the file does not exist.
         :raise OSError: if the file could not be opened.
         """
-        with tempfile.TemporaryFile(mode='w+b') as handle:
-            try:
-                self._container_client.download_blob(key).readinto(handle)
-            except Exception as exception:
-                raise FileNotFoundError(f'object with key `{key}` does not exist.') from exception
-            handle.seek(0)
+        with self._download(key) as handle:
             yield handle
 
+    def _download(self, key: str, max_concurrency: int | None = None) -> t.IO[bytes]:
+        """Download the blob stored under the given key.
+
+        The content of the blob is streamed into a temporary file that is kept in memory up to ``spool_max_size`` bytes.
+        Large blobs are downloaded in chunks that are requested concurrently by up to ``max_workers`` threads. The
+        caller is responsible for closing the returned handle.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :param max_concurrency: maximum number of chunks requested concurrently, defaults to ``max_workers``.
+        :return: byte stream with the content of the object, positioned at the start.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        handle = tempfile.SpooledTemporaryFile(max_size=self.spool_max_size, mode='w+b')
+        max_concurrency = max_concurrency or self.max_workers
+
+        try:
+            self._container_client.download_blob(key, max_concurrency=max_concurrency).readinto(handle)
+        except Exception as exception:
+            handle.close()
+            raise FileNotFoundError(f'object with key `{key}` does not exist.') from exception
+
+        handle.seek(0)
+        return handle
+
     def iter_object_streams(self, keys: list[str]) -> t.Iterator[tuple[str, t.IO[bytes]]]:  # type: ignore[override]
         """Return an iterator over the (read-only) byte streams of objects identified by key.
 
+        Up to ``max_prefetch`` blobs are downloaded concurrently, so the chunks of each large blob are requested with a
+        correspondingly smaller share of ``max_workers``.
+
         .. note:: handles should only be read within the context of this iterator.
 
         :param keys: fully qualified identifiers for the objects within the repository.
@@ -137,9 +221,8 @@ class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
         :raise FileNotFoundError: if the file does not exist.
         :raise OSError: if a file could not be opened.
         """
-        for key in keys:
-            with self.open(key) as handle:
-                yield key, handle
+        download = functools.partial(self._download, max_concurrency=max(1, self.max_workers // self.max_prefetch))
+        yield from iter_prefetched(keys, download, self.max_prefetch)
 
     def delete_objects(self, keys: t.Iterable[str]) -> None:
         """Delete the objects from the repository.
@@ -148,9 +231,38 @@ class AzureBlobStorageRepositoryBackend(AbstractRepositoryBackend):
         :raise FileNotFoundError: if any of the files does not exist.
         :raise OSError: if any of the files could not be deleted.
         """
-        super().delete_objects(list(keys))
-        if keys:
-            self._container_client.delete_blobs(*keys)
+        keys = list(keys)
+        super().delete_objects(keys)
+        self._delete_objects(keys)
+
+    def _delete_objects(self, keys: t.Iterable[str]) -> None:
+        """Delete the objects from the repository without checking whether they exist.
+
+        The keys are consumed lazily and deleted in batches of ``delete_objects_batch_size``, which are sent
+        concurrently. At most ``max_workers`` batches are held in memory at any time.
+
+        :param keys: iterable of fully qualified identifiers for the objects within the repository.
+        :raise OSError: if any of the objects could not be deleted.
+        """
+        from azure.core.exceptions import HttpResponseError
+
+        def delete(batch: list[str]) -> None:
+            self._container_client.delete_blobs(*batch)
+
+        try:
+            for _ in map_bounded(delete, batched(keys, self.delete_objects_batch_size), self.max_workers):
+                pass
+        except HttpResponseError as exception:
+            raise OSError(f'some of the objects could not be deleted: {exception}') from exception
+
+    def delete_all_objects(self) -> None:
+        """Delete all objects from the repository, while keeping the container itself.
+
+        The keys come straight from ``list_objects`` so they are deleted without first checking that they exist.
+
+        :raise OSError: if any of the objects could not be deleted.
+        """
+        self._delete_objects(self.list_objects())
 
     def list_objects(self) -> t.Iterable[str]:
         """Return iterable that yields all available objects by key.
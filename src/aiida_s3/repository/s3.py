@@ -2,21 +2,57 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
+import functools
+import os
+import shutil
 import tempfile
 import typing as t
 import uuid
 
-import boto3
-import botocore
 from aiida.repository.backend.abstract import AbstractRepositoryBackend
 
+from .utils import batched, iter_prefetched, map_bounded
+
+if t.TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+    from botocore.client import BaseClient
+    from botocore.config import Config
+
 __all__ = ('S3RepositoryBackend',)
 
 
 class S3RepositoryBackend(AbstractRepositoryBackend):
     """Implementation of the ``AbstractRepositoryBackend`` using S3 as the backend."""
 
+    max_pool_connections: t.ClassVar[int] = 64
+    """Maximum number of connections kept in the connection pool of the client."""
+
+    max_workers: t.ClassVar[int] = 32
+    """Maximum number of threads used to perform requests concurrently."""
+
+    has_objects_list_threshold: t.ClassVar[int] = 1000
+    """Number of keys above which ``has_objects`` lists the bucket instead of requesting each object separately."""
+
+    delete_objects_batch_size: t.ClassVar[int] = 1000
+    """Maximum number of keys deleted per request, which is the limit imposed by the ``DeleteObjects`` operation."""
+
+    multipart_threshold: t.ClassVar[int] = 8 * 1024 * 1024
+    """Size in bytes above which objects are uploaded and downloaded in multiple parts concurrently."""
+
+    multipart_chunksize: t.ClassVar[int] = 8 * 1024 * 1024
+    """Size in bytes of each part of a multipart upload or download."""
+
+    max_prefetch: t.ClassVar[int] = 16
+    """Maximum number of objects downloaded ahead of the consumer by ``iter_object_streams``."""
+
+    spool_max_size: t.ClassVar[int] = 8 * 1024 * 1024
+    """Size in bytes up to which downloaded objects are kept in memory before being spooled to disk."""
+
+    _bucket_verified: bool = False
+    """Whether the bucket is known to exist, in which case it is no longer checked with a request."""
+
     def __init__(self, endpoint_url: str, access_key_id: str, secret_access_key: str, bucket_name: str):
         """Construct a new instance for a given bucket.
 
@@ -30,8 +66,7 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
         :param bucket_name: The name of the bucket to use.
         """
         self._bucket_name = bucket_name
-        self._client = boto3.client(
-            's3',
+        self._client = self._get_client(
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key,
@@ -41,14 +76,82 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
         """Return the string representation of this repository."""
         return f'S3RepositoryBackend: <{self._bucket_name}>'
 
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _get_client(
+        cls,
+        endpoint_url: str | None = None,
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        region_name: str | None = None,
+    ) -> BaseClient:
+        """Return a client for the given connection parameters.
+
+        Clients are thread-safe, so a single client, with its own session, is created per set of parameters and shared
+        by all instances that use them. This avoids reloading the service model and re-establishing connections each
+        time a repository is constructed.
+
+        :param endpoint_url: The endpoint URL of the server to connect to.
+        :param aws_access_key_id: The access key ID to use to authenticate.
+        :param aws_secret_access_key: The secret access key to use to authenticate.
+        :param region_name: The region name.
+        :return: Instance of :class:`botocore.client.BaseClient`.
+        """
+        import boto3
+
+        session = boto3.session.Session(
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
+        )
+        return session.client('s3', endpoint_url=endpoint_url, config=cls._get_client_config())
+
+    @classmethod
+    def _get_client_config(cls) -> Config:
+        """Return the configuration for the client.
+
+        The connection pool is enlarged from the default of 10 and TCP keep-alive is enabled, such that connections
+        are reused for concurrent requests instead of being re-established.
+
+        :return: Instance of :class:`botocore.config.Config`.
+        """
+        from botocore.config import Config
+
+        return Config(max_pool_connections=cls.max_pool_connections, tcp_keepalive=True)
+
+    @classmethod
+    def _get_transfer_config(cls) -> TransferConfig:
+        """Return the configuration for managed uploads.
+
+        :return: Instance of :class:`boto3.s3.transfer.TransferConfig`.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        return TransferConfig(
+            multipart_threshold=cls.multipart_threshold,
+            multipart_chunksize=cls.multipart_chunksize,
+            max_concurrency=min(cls.max_workers, cls.max_pool_connections),
+            use_threads=True,
+        )
+
     @property
     def _bucket_exists(self) -> bool:
-        """Return whether the bucket exists."""
+        """Return whether the bucket exists.
+
+        Once the bucket has been found to exist, this is remembered and no further requests are made until ``erase``
+        is called.
+        """
+        from botocore.exceptions import ClientError
+
+        if self._bucket_verified:
+            return True
+
         try:
             self._client.head_bucket(Bucket=self._bucket_name)
-        except botocore.exceptions.ClientError:
+        except ClientError:
             return False
 
+        self._bucket_verified = True
         return True
 
     @property
@@ -69,6 +172,7 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
             return
 
         self._client.create_bucket(Bucket=self._bucket_name, **kwargs)
+        self._bucket_verified = True
 
     @property
     def uuid(self) -> str:
@@ -85,18 +189,35 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
         if not self._bucket_exists:
             return
 
-        self.delete_objects(list(self.list_objects()))
+        self._delete_objects(self.list_objects())
         self._client.delete_bucket(Bucket=self._bucket_name)
+        self._bucket_verified = False
 
     def _put_object_from_filelike(self, handle: t.BinaryIO) -> str:
         """Store the byte contents of a file in the repository.
 
+        Objects up to ``multipart_threshold`` bytes are stored with a single ``PutObject`` request. Larger objects, or
+        streams whose size cannot be determined, for example because they are not seekable, are uploaded through a
+        managed transfer, which sends them in multiple parts concurrently.
+
         :param handle: filelike object with the byte content to be stored.
         :return: the generated fully qualified identifier for the object within the repository.
         :raises TypeError: if the handle is not a byte stream.
         """
         key = str(uuid.uuid4())
-        self._client.put_object(Bucket=self._bucket_name, Body=handle, Key=key)
+
+        try:
+            position = handle.tell()
+            size = handle.seek(0, os.SEEK_END) - position
+            handle.seek(position)
+        except (AttributeError, OSError):
+            size = None
+
+        if size is not None and size <= self.multipart_threshold:
+            self._client.put_object(Bucket=self._bucket_name, Body=handle, Key=key)
+        else:
+            self._client.upload_fileobj(handle, self._bucket_name, key, Config=self._get_transfer_config())
+
         return key
 
     def has_objects(self, keys: list[str]) -> list[bool]:
@@ -106,8 +227,32 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
         :return: list of booleans, in the same order as the keys provided, with value True if the respective object
             exists and False otherwise.
         """
-        existing_keys = set(self.list_objects())
-        return [key in existing_keys for key in keys]
+        if len(keys) > self.has_objects_list_threshold:
+            existing_keys = set(self.list_objects())
+            return [key in existing_keys for key in keys]
+
+        if len(keys) <= 1:
+            return [self._has_object(key) for key in keys]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(keys))) as executor:
+            return list(executor.map(self._has_object, keys))
+
+    def _has_object(self, key: str) -> bool:
+        """Return whether the repository has an object with the given key.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :return: True if the object exists, False otherwise.
+        """
+        from botocore.exceptions import ClientError
+
+        try:
+            self._client.head_object(Bucket=self._bucket_name, Key=key)
+        except ClientError as exception:
+            if exception.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                return False
+            raise
+
+        return True
 
     @contextlib.contextmanager
     def open(self, key: str) -> t.Iterator[t.IO[bytes]]:  # type: ignore[override]
@@ -121,17 +266,69 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
         :raise FileNotFoundError: if the file does not exist.
         :raise OSError: if the file could not be opened.
         """
+        with self._download(key) as handle:
+            yield handle
+
+    def _download(self, key: str, max_concurrency: int | None = None) -> t.IO[bytes]:
+        """Download the object stored under the given key.
+
+        The first ``multipart_threshold`` bytes of the object are fetched with a single ``GetObject`` request and are
+        streamed into a temporary file that is kept in memory up to ``spool_max_size`` bytes. If the object is larger,
+        the remaining bytes are fetched as ranges of ``multipart_chunksize`` that are requested concurrently. The caller
+        is responsible for closing the returned handle.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :param max_concurrency: maximum number of ranges requested concurrently, defaults to ``max_workers``.
+        :return: byte stream with the content of the object, positioned at the start.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        from botocore.exceptions import ClientError
+
+        def get(start: int, end: int) -> dict[str, t.Any]:
+            try:
+                response: dict[str, t.Any] = self._client.get_object(
+                    Bucket=self._bucket_name, Key=key, Range=f'bytes={start}-{end}'
+                )
+            except ClientError as exception:
+                # The range of the first request can only be unsatisfiable if the object exists but is empty.
+                if start == 0 and exception.response['Error']['Code'] == 'InvalidRange':
+                    return {'ContentLength': 0}
+                raise FileNotFoundError(f'object with key `{key}` does not exist.') from exception
+            return response
+
+        def get_range(start: int) -> bytes:
+            response = get(start, min(start + self.multipart_chunksize, size) - 1)
+            with contextlib.closing(response['Body']) as body:
+                content: bytes = body.read()
+            return content
+
+        response = get(0, self.multipart_threshold - 1)
+        handle = tempfile.SpooledTemporaryFile(max_size=self.spool_max_size)
+
         try:
-            with tempfile.TemporaryFile() as handle:
-                self._client.download_fileobj(self._bucket_name, key, handle)
-                handle.seek(0)
-                yield handle
-        except botocore.exceptions.ClientError as exception:
-            raise FileNotFoundError(f'object with key `{key}` does not exist.') from exception
+            if 'Body' in response:
+                with contextlib.closing(response['Body']) as body:
+                    shutil.copyfileobj(body, handle)
+
+            # The total size is reported by the content range, which is only missing if the server ignored the range.
+            size = int(response.get('ContentRange', '').rpartition('/')[2] or response['ContentLength'])
+            offsets = range(response['ContentLength'], size, self.multipart_chunksize)
+
+            for content in map_bounded(get_range, offsets, max_concurrency or self.max_workers):
+                handle.write(content)
+        except BaseException:
+            handle.close()
+            raise
+
+        handle.seek(0)
+        return handle
 
     def iter_object_streams(self, keys: list[str]) -> t.Iterator[tuple[str, t.IO[bytes]]]:  # type: ignore[override]
         """Return an iterator over the (read-only) byte streams of objects identified by key.
 
+        Up to ``max_prefetch`` objects are downloaded concurrently, so the ranges of each large object are requested
+        with a correspondingly smaller share of ``max_workers``.
+
         .. note:: handles should only be read within the context of this iterator.
 
         :param keys: fully qualified identifiers for the objects within the repository.
@@ -139,9 +336,8 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
         :raise FileNotFoundError: if the file does not exist.
         :raise OSError: if a file could not be opened.
         """
-        for key in keys:
-            with self.open(key) as handle:
-                yield key, handle
+        download = functools.partial(self._download, max_concurrency=max(1, self.max_workers // self.max_prefetch))
+        yield from iter_prefetched(keys, download, self.max_prefetch)
 
     def delete_objects(self, keys: list[str]) -> None:
         """Delete the objects from the repository.
@@ -151,24 +347,42 @@ class S3RepositoryBackend(AbstractRepositoryBackend):
         :raise OSError: if any of the files could not be deleted.
         """
         super().delete_objects(keys)
-        if keys:
-            self._client.delete_objects(Bucket=self._bucket_name, Delete={'Objects': [{'Key': key} for key in keys]})
+        self._delete_objects(keys)
+
+    def _delete_objects(self, keys: t.Iterable[str]) -> None:
+        """Delete the objects from the repository without checking whether they exist.
+
+        The keys are consumed lazily and deleted in batches of ``delete_objects_batch_size``, which are sent
+        concurrently. At most ``max_workers`` batches are held in memory at any time.
+
+        :param keys: iterable of fully qualified identifiers for the objects within the repository.
+        :raise OSError: if any of the objects could not be deleted.
+        """
+
+        def delete(batch: list[str]) -> list[dict[str, str]]:
+            objects = {'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+            response = self._client.delete_objects(Bucket=self._bucket_name, Delete=objects)
+            errors: list[dict[str, str]] = response.get('Errors', [])
+            return errors
+
+        batches = batched(keys, self.delete_objects_batch_size)
+        errors = [error for batch_errors in map_bounded(delete, batches, self.max_workers) for error in batch_errors]
+
+        if errors:
+            error_message = 'some of the objects could not be deleted:\n'
+            for error in errors:
+                error_message += f' > object with key `{error["Key"]}`: {error["Message"]}\n'
+            raise OSError(error_message)
 
     def list_objects(self) -> t.Iterable[str]:
         """Return iterable that yields all available objects by key.
 
         :return: An iterable for all the available object keys.
         """
-        kwargs = {'Bucket': self._bucket_name}
         paginator = self._client.get_paginator('list_objects_v2')
 
-        for page in paginator.paginate(**kwargs):
-            try:
-                contents = page['Contents']
-            except KeyError:
-                break
-
-            for obj in contents:
+        for page in paginator.paginate(Bucket=self._bucket_name):
+            for obj in page.get('Contents', ()):
                 yield obj['Key']
 
     def maintain(  # type: ignore[override]  # noqa: PLR0913
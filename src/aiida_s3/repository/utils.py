@@ -0,0 +1,101 @@
+"""Utilities shared by the repository backend implementations."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import itertools
+import typing as t
+
+__all__ = ('batched', 'iter_prefetched', 'map_bounded')
+
+T = t.TypeVar('T')
+R = t.TypeVar('R')
+
+
+def batched(iterable: t.Iterable[T], size: int) -> t.Iterator[list[T]]:
+    """Return an iterator over consecutive batches of at most ``size`` elements of the given iterable.
+
+    The iterable is consumed lazily, so at most one batch is held in memory at a time.
+
+    :param iterable: the elements to batch.
+    :param size: the maximum number of elements per batch.
+    :return: an iterator over lists of elements.
+    """
+    iterator = iter(iterable)
+
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def iter_prefetched(
+    keys: t.Iterable[str], download: t.Callable[[str], t.IO[bytes]], max_prefetch: int
+) -> t.Iterator[tuple[str, t.IO[bytes]]]:
+    """Return an iterator over the byte streams of the given keys, downloading upcoming objects in the background.
+
+    At most ``max_prefetch`` objects are being downloaded or waiting to be consumed at any time. The streams are yielded
+    in the same order as the keys and each handle is closed as soon as the iterator advances to the next key.
+
+    :param keys: fully qualified identifiers for the objects within the repository.
+    :param download: callable that downloads the object with the given key and returns an open byte stream.
+    :param max_prefetch: maximum number of objects that are downloaded concurrently.
+    :return: an iterator over the object byte streams.
+    :raise FileNotFoundError: if the file does not exist.
+    """
+    iterator = iter(keys)
+    pending: collections.deque[tuple[str, concurrent.futures.Future[t.IO[bytes]]]] = collections.deque()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_prefetch) as executor:
+        try:
+            for key in itertools.islice(iterator, max_prefetch):
+                pending.append((key, executor.submit(download, key)))
+
+            while pending:
+                key, future = pending.popleft()
+
+                for upcoming in itertools.islice(iterator, 1):
+                    pending.append((upcoming, executor.submit(download, upcoming)))
+
+                with future.result() as handle:
+                    yield key, handle
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+            concurrent.futures.wait([future for _, future in pending])
+
+            for _, future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().close()
+
+
+def map_bounded(function: t.Callable[[T], R], iterable: t.Iterable[T], max_workers: int) -> t.Iterator[R]:
+    """Return an iterator over the results of calling ``function`` on each element of the iterable in a thread pool.
+
+    Unlike :meth:`concurrent.futures.Executor.map`, the iterable is consumed lazily: at most ``max_workers`` calls are
+    submitted or waiting to be consumed at any time, so memory stays bounded regardless of the number of elements. The
+    results are yielded in the same order as the elements.
+
+    :param function: callable to apply to each element.
+    :param iterable: the elements to apply the callable to.
+    :param max_workers: maximum number of calls that are executed concurrently.
+    :return: an iterator over the results.
+    """
+    iterator = iter(iterable)
+    pending: collections.deque[concurrent.futures.Future[R]] = collections.deque()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for element in itertools.islice(iterator, max_workers):
+                pending.append(executor.submit(function, element))
+
+            while pending:
+                future = pending.popleft()
+
+                for upcoming in itertools.islice(iterator, 1):
+                    pending.append(executor.submit(function, upcoming))
+
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
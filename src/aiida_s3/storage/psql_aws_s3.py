@@ -8,7 +8,7 @@ from aiida.storage.psql_dos import PsqlDosBackend
 from pydantic import Field
 
 from ..repository.aws_s3 import AwsS3RepositoryBackend
-from .psql_s3 import PsqlS3StorageMigrator
+from .psql_s3 import PsqlS3StorageMigrator, RepositoryCacheMixin
 
 
 class PsqlAwsS3StorageMigrator(PsqlS3StorageMigrator):
@@ -19,8 +19,15 @@ class PsqlAwsS3StorageMigrator(PsqlS3StorageMigrator):
 
         :returns: The repository of the configured profile.
         """
-        storage_config = self.profile.storage_config
+        return self.get_repository_from_config(self.profile.storage_config)
 
+    @staticmethod
+    def get_repository_from_config(storage_config: dict[str, t.Any]) -> AwsS3RepositoryBackend:
+        """Return the file repository backend instance for the given storage configuration.
+
+        :param storage_config: The storage configuration of a profile.
+        :returns: The repository of the storage configuration.
+        """
         return AwsS3RepositoryBackend(
             aws_access_key_id=storage_config['aws_access_key_id'],
             aws_secret_access_key=storage_config['aws_secret_access_key'],
@@ -29,7 +36,7 @@ class PsqlAwsS3StorageMigrator(PsqlS3StorageMigrator):
         )
 
 
-class PsqlAwsS3Storage(PsqlDosBackend):
+class PsqlAwsS3Storage(RepositoryCacheMixin, PsqlDosBackend):
     """Storage backend using PostgresSQL and AWS S3."""
 
     migrator = PsqlAwsS3StorageMigrator
@@ -55,9 +62,16 @@ class PsqlAwsS3Storage(PsqlDosBackend):
         )
         repository_uri: t.ClassVar[None]  # type: ignore[assignment,misc]
 
+    _repository: AwsS3RepositoryBackend | None = None
+
     def get_repository(self) -> AwsS3RepositoryBackend:  # type: ignore[override]
         """Return the file repository backend instance.
 
+        The instance is created on the first call and reused afterwards.
+
         :returns: The repository of the configured profile.
         """
-        return self.migrator(self.profile).get_repository()
+        if self._repository is None:
+            self._repository = self.migrator.get_repository_from_config(self.profile.storage_config)
+
+        return self._repository
@@ -2,38 +2,55 @@
 
 from __future__ import annotations
 
+import functools
 import typing as t
 
 from aiida.storage.psql_dos.backend import PsqlDosBackend
 from pydantic import Field
 
 from ..repository.azure_blob import AzureBlobStorageRepositoryBackend
-from .psql_s3 import PsqlS3StorageMigrator
+from .psql_s3 import PsqlS3StorageMigrator, RepositoryCacheMixin
 
 
 class PsqlAzureBlobStorageMigrator(PsqlS3StorageMigrator):
     """Subclass :class:`aiida.storage.psql_dos.migrator.PsqlDosMigrator` to customize the repository implementation."""
 
+    @functools.cached_property
+    def repository(self) -> AzureBlobStorageRepositoryBackend:  # type: ignore[override]
+        """Return the file repository backend instance, which is retrieved once per migrator.
+
+        :returns: The repository of the configured profile.
+        """
+        return self.get_repository()
+
     def reset_repository(self) -> None:
-        """Reset the repository deleting the bucket and all its contents."""
-        repository = self.get_repository()
-        if repository.is_initialised:
-            repository.delete_objects(repository.list_objects())
+        """Reset the repository deleting all the contents of the container."""
+        if self.repository.is_initialised:
+            self.repository.delete_all_objects()
 
     def get_repository(self) -> AzureBlobStorageRepositoryBackend:  # type: ignore[override]
         """Return the file repository backend instance.
 
         :returns: The repository of the configured profile.
         """
-        storage_config = self.profile.storage_config
+        return self.get_repository_from_config(self.profile.storage_config)
+
+    @staticmethod
+    def get_repository_from_config(  # type: ignore[override]
+        storage_config: dict[str, t.Any],
+    ) -> AzureBlobStorageRepositoryBackend:
+        """Return the file repository backend instance for the given storage configuration.
 
+        :param storage_config: The storage configuration of a profile.
+        :returns: The repository of the storage configuration.
+        """
         return AzureBlobStorageRepositoryBackend(
             container_name=storage_config['container_name'],
             connection_string=storage_config['connection_string'],
         )
 
 
-class PsqlAzureBlobStorage(PsqlDosBackend):
+class PsqlAzureBlobStorage(RepositoryCacheMixin, PsqlDosBackend):
     """Storage backend using PostgresSQL and Azure Blob Storage."""
 
     migrator = PsqlAzureBlobStorageMigrator
@@ -51,9 +68,16 @@ class PsqlAzureBlobStorage(PsqlDosBackend):
         )
         repository_uri: t.ClassVar[None]  # type: ignore[assignment,misc]
 
+    _repository: AzureBlobStorageRepositoryBackend | None = None
+
     def get_repository(self) -> AzureBlobStorageRepositoryBackend:  # type: ignore[override]
         """Return the file repository backend instance.
 
+        The instance is created on the first call and reused afterwards.
+
         :returns: The repository of the configured profile.
         """
-        return self.migrator(self.profile).get_repository()
+        if self._repository is None:
+            self._repository = self.migrator.get_repository_from_config(self.profile.storage_config)
+
+        return self._repository
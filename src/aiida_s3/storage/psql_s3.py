@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import typing as t
 
 from aiida.storage.psql_dos.backend import PsqlDosBackend
@@ -10,27 +11,36 @@ from pydantic import Field
 
 from ..repository.s3 import S3RepositoryBackend
 
+if t.TYPE_CHECKING:
+    from aiida.repository.backend.abstract import AbstractRepositoryBackend
+
 
 class PsqlS3StorageMigrator(PsqlDosMigrator):
     """Subclass :class:`aiida.storage.psql_dos.migrator.PsqlDosMigrator` to customize the repository implementation."""
 
+    @functools.cached_property
+    def repository(self) -> S3RepositoryBackend:
+        """Return the file repository backend instance, which is retrieved once per migrator.
+
+        :returns: The repository of the configured profile.
+        """
+        return self.get_repository()
+
     def get_repository_uuid(self) -> str:
         """Return the UUID of the repository.
 
         :returns: The UUID of the repository of the configured profile.
         """
-        return self.get_repository().uuid
+        return self.repository.uuid
 
     def reset_repository(self) -> None:
         """Reset the repository deleting the bucket and all its contents."""
-        repository = self.get_repository()
-        if repository.is_initialised:
-            repository.erase()
+        if self.repository.is_initialised:
+            self.repository.erase()
 
     def initialise_repository(self) -> None:
         """Initialise the repository."""
-        repository = self.get_repository()
-        repository.initialise()
+        self.repository.initialise()
 
     @property
     def is_repository_initialised(self) -> bool:
@@ -38,15 +48,24 @@ class PsqlS3StorageMigrator(PsqlDosMigrator):
 
         :returns: Boolean, ``True`` if the repository is initalised, ``False`` otherwise.
         """
-        return self.get_repository().is_initialised
+        return self.repository.is_initialised
 
     def get_repository(self) -> S3RepositoryBackend:
         """Return the file repository backend instance.
 
         :returns: The repository of the configured profile.
         """
-        storage_config = self.profile.storage_config
+        return self.get_repository_from_config(self.profile.storage_config)
 
+    @staticmethod
+    def get_repository_from_config(storage_config: dict[str, t.Any]) -> S3RepositoryBackend:
+        """Return the file repository backend instance for the given storage configuration.
+
+        This does not require a migrator instance, whose construction creates a database engine, to be created.
+
+        :param storage_config: The storage configuration of a profile.
+        :returns: The repository of the storage configuration.
+        """
         return S3RepositoryBackend(
             endpoint_url=storage_config['endpoint_url'],
             access_key_id=storage_config['access_key_id'],
@@ -55,7 +74,28 @@ class PsqlS3StorageMigrator(PsqlDosMigrator):
         )
 
 
-class PsqlS3Storage(PsqlDosBackend):
+class RepositoryCacheMixin:
+    """Mixin for storage backends that cache the repository backend instance returned by ``get_repository``.
+
+    The mixin should precede :class:`aiida.storage.psql_dos.backend.PsqlDosBackend` in the bases of the storage class.
+    """
+
+    _repository: AbstractRepositoryBackend | None = None
+
+    def _clear(self) -> None:
+        """Clear the storage and discard the cached repository instance.
+
+        The migrator resets and initialises the repository through its own instance, so the cached instance may hold
+        state that no longer applies, for example whether an S3 bucket exists. The next call to ``get_repository``
+        creates a new instance instead.
+        """
+        try:
+            super()._clear()  # type: ignore[misc]
+        finally:
+            self._repository = None
+
+
+class PsqlS3Storage(RepositoryCacheMixin, PsqlDosBackend):
     """Storage backend using PostgresSQL and S3 object store."""
 
     migrator = PsqlS3StorageMigrator
@@ -81,9 +121,16 @@ class PsqlS3Storage(PsqlDosBackend):
         )
         repository_uri: t.ClassVar[None]  # type: ignore[assignment,misc]
 
+    _repository: S3RepositoryBackend | None = None
+
     def get_repository(self) -> S3RepositoryBackend:  # type: ignore[override]
         """Return the file repository backend instance.
 
+        The instance is created on the first call and reused afterwards.
+
         :returns: The repository of the configured profile.
         """
-        return self.migrator(self.profile).get_repository()
+        if self._repository is None:
+            self._repository = self.migrator.get_repository_from_config(self.profile.storage_config)
+
+        return self._repository
@@ -1,5 +1,6 @@
 """Tests for ``verdi profile setup``."""
 
+import os
 import pathlib
 
 import pytest
@@ -8,15 +9,44 @@ from aiida.cmdline.commands.cmd_profile import profile_setup
 from aiida.plugins import StorageFactory
 from click.testing import CliRunner
 
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+RUNNER = CliRunner()
+DIRPATH_CONFIG = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'static', 'config')
+
 
 def filepath_config():
     """Return an iterator over the files in the ``tests/static/config`` directory."""
-    for filepath in (pathlib.Path(__file__).parent.parent / 'static' / 'config').iterdir():
-        yield filepath
+    with os.scandir(DIRPATH_CONFIG) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield pathlib.Path(entry.path)
+
+
+def load_config(filepath):
+    """Return the parsed content of the given YAML configuration file."""
+    with filepath.open() as handle:
+        return yaml.load(handle, Loader=Loader)
+
+
+CONFIGS = {filepath: load_config(filepath) for filepath in filepath_config()}
+
 
+@pytest.fixture(scope='module')
+def patch_storage_initialise():
+    """Patch the ``initialise`` method of the storage classes of all configuration files to be a no-op.
 
-@pytest.mark.parametrize('filepath_config', filepath_config())
-def test_setup(aiida_config_tmp, monkeypatch, filepath_config):
+    The entry points are resolved and patched once for the module, and the patches are undone when it finishes.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for filepath in CONFIGS:
+            monkeypatch.setattr(StorageFactory(f's3.{filepath.stem}'), 'initialise', lambda *args: True)
+
+        yield
+
+
+@pytest.mark.usefixtures('patch_storage_initialise')
+@pytest.mark.parametrize('filepath_config, profile_config', CONFIGS.items())
+def test_setup(aiida_config_tmp, monkeypatch, filepath_config, profile_config):
     """Test the ``verdi profile setup`` command for all storage backends.
 
     This will just verify that the command accepts the ``--config`` option with a valid YAML file containing the options
@@ -26,16 +56,11 @@ def test_setup(aiida_config_tmp, monkeypatch, filepath_config):
     """
     from aiida.manage import configuration
 
-    with filepath_config.open() as handle:
-        profile_config = yaml.safe_load(handle)
-
     entry_point = f's3.{filepath_config.stem}'
-    cls = StorageFactory(entry_point)
     profile_name = profile_config['profile']
 
-    monkeypatch.setattr(cls, 'initialise', lambda *args: True)
     monkeypatch.setattr(configuration, 'create_default_user', lambda *args: None)
 
-    result = CliRunner().invoke(profile_setup, [entry_point, '-n', '--config', str(filepath_config)])
+    result = RUNNER.invoke(profile_setup, [entry_point, '-n', '--config', str(filepath_config)])
     assert f'Success: Created new profile `{profile_name}`.' in result.output
     assert profile_name in aiida_config_tmp.profile_names
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import contextlib
+import json
 import os
 import pathlib
+import shutil
 import typing as t
 import uuid
 
-import boto3
-import botocore
-import moto
 import pytest
-from aiida.manage.configuration.profile import Profile
+
+if t.TYPE_CHECKING:
+    import botocore.client
+    import botocore.session
+    from aiida.manage.configuration.profile import Profile
 
 pytest_plugins = 'aiida.tools.pytest_fixtures'
 
+# The environment variables that control whether services are mocked are read once when the module is imported.
+MOCK_S3 = os.getenv('AIIDA_S3_MOCK_S3', 'True') == 'True'
+MOCK_AWS_S3 = os.getenv('AIIDA_S3_MOCK_AWS_S3', 'True') == 'True'
+MOCK_AZURE_BLOB = os.getenv('AIIDA_S3_MOCK_AZURE_BLOB', 'True') == 'True'
+
 
 def recursive_merge(left: dict[t.Any, t.Any], right: dict[t.Any, t.Any]) -> None:
     """Recursively merge the ``right`` dictionary into the ``left`` dictionary.
@@ -23,11 +33,68 @@ def recursive_merge(left: dict[t.Any, t.Any], right: dict[t.Any, t.Any]) -> None
     :param left: Base dictionary.
     :param right: Dictionary to recurisvely merge on top of ``left`` dictionary.
     """
-    for key, value in right.items():
-        if key in left and isinstance(left[key], dict) and isinstance(value, dict):
-            recursive_merge(left[key], value)
-        else:
-            left[key] = value
+    queue = collections.deque([(left, right)])
+
+    while queue:
+        base, update = queue.popleft()
+
+        for key, value in update.items():
+            current = base.get(key)
+
+            if isinstance(current, dict) and isinstance(value, dict):
+                queue.append((current, value))
+            else:
+                base[key] = value
+
+
+@pytest.fixture(scope='session')
+def botocore_session() -> botocore.session.Session:
+    """Return a ``botocore`` session that is shared by all clients created by the fixtures.
+
+    The service models are loaded by the session, so sharing it means they are only loaded once per test session.
+    """
+    import botocore.session
+
+    return botocore.session.Session()
+
+
+def empty_bucket(client: botocore.client.BaseClient, bucket_name: str) -> None:
+    """Delete all objects in the given bucket.
+
+    Each page of keys holds at most 1000 keys, which is the maximum accepted by a single ``delete_objects`` request. The
+    pages are deleted concurrently by a small thread pool.
+
+    :param client: The S3 client.
+    :param bucket_name: The name of the bucket to empty.
+    """
+    paginator = client.get_paginator('list_objects_v2')
+
+    def delete(page: dict[str, t.Any]) -> None:
+        objects = [{'Key': item['Key']} for item in page.get('Contents', [])]
+        if objects:
+            client.delete_objects(Bucket=bucket_name, Delete={'Objects': objects, 'Quiet': True})
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in executor.map(delete, paginator.paginate(Bucket=bucket_name)):
+            pass
+
+
+@pytest.fixture(scope='session')
+def mock_s3(should_mock_s3, should_mock_aws_s3) -> t.Generator[None, None, None]:
+    """Mock S3 for the entire session using the ``moto`` library if either S3 or AWS S3 should be mocked.
+
+    A single mock is shared by the ``s3`` and ``aws_s3`` fixtures. As of ``moto==5.0`` all services are mocked through
+    ``mock_aws``, which replaces the service specific ``mock_s3``. The library is only imported when mocking is
+    required, since importing it is relatively expensive.
+    """
+    if not should_mock_s3 and not should_mock_aws_s3:
+        yield
+        return
+
+    import moto
+
+    with (getattr(moto, 'mock_aws', None) or moto.mock_s3)():
+        yield
 
 
 @pytest.fixture(scope='session')
@@ -39,8 +106,7 @@ def should_mock_s3() -> bool:
 
     :return: Boolean as to whether the S3 client connection should be mocked.
     """
-    default = 'True'
-    return os.getenv('AIIDA_S3_MOCK_S3', default) == default
+    return MOCK_S3
 
 
 @pytest.fixture(scope='session')
@@ -48,7 +114,8 @@ def s3_bucket_name(should_mock_s3) -> str:
     """Return the name of the bucket used for this session.
 
     Returns the value defined by the ``AIIDA_S3_BUCKET_NAME`` environment variable if defined and ``AIIDA_S3_MOCK_S3``
-    is set to ``True``, otherwise generates a random name based on :func:`uuid.uuid4`.
+    is set to ``True``, otherwise generates a random name based on :func:`uuid.uuid4`. A name defined by the
+    environment variable is used as is, so it is shared by all ``pytest-xdist`` workers.
 
     :return: Name of the bucket used for this session.
     """
@@ -74,8 +141,8 @@ def s3_config(should_mock_s3) -> dict:
     }
 
 
-@pytest.fixture(scope='session', autouse=True)
-def s3(should_mock_s3, s3_bucket_name, s3_config) -> t.Generator[dict, None, None]:
+@pytest.fixture(scope='session')
+def s3(mock_s3, s3_bucket_name, s3_config) -> dict[str, str]:
     """Return the S3 connection configuration for the session.
 
     The return value is a dictionary with the following keys:
@@ -88,8 +155,8 @@ def s3(should_mock_s3, s3_bucket_name, s3_config) -> t.Generator[dict, None, Non
     These values are provided by the ``s3_bucket_name`` and ``s3_config`` fixtures, respectively. See their
     documentation how to specify access credentials using environment variables.
 
-    Unless ``AIIDA_S3_MOCK_S3`` is set to ``True``, the S3 client will be mocked for the entire session using
-    the ``moto`` library.
+    Unless ``AIIDA_S3_MOCK_S3`` is set to ``True``, the S3 client will be mocked for the entire session through the
+    ``mock_s3`` fixture.
 
     :return: Dictionary with the connection parameters used to connect to S3.
     """
@@ -99,14 +166,11 @@ def s3(should_mock_s3, s3_bucket_name, s3_config) -> t.Generator[dict, None, Non
         'secret_access_key': s3_config['secret_access_key'],
         'bucket_name': s3_bucket_name,
     }
-    context = moto.mock_s3 if should_mock_s3 else contextlib.nullcontext
-
-    with context():
-        yield config
+    return config
 
 
 @pytest.fixture(scope='session')
-def s3_client(s3) -> botocore.client.BaseClient:
+def s3_client(s3, botocore_session) -> botocore.client.BaseClient:
     """Return an S3 client for the session.
 
     A client using ``boto3`` will be initialised if and only if ``AIIDA_S3_MOCK_S3`` is set to ``True``. Otherwise
@@ -117,30 +181,30 @@ def s3_client(s3) -> botocore.client.BaseClient:
     session. This means that when using this fixture, the cleanup is automatic. Note, however, that if other buckets are
     created, the tests bare the responsibility of cleaning those up themselves.
     """
+    import boto3
+    from botocore.exceptions import ClientError
+
     bucket_name = s3['bucket_name']
-    client = boto3.client(
+    client = boto3.Session(botocore_session=botocore_session).client(
         's3',
         endpoint_url=s3['endpoint_url'],
-        access_key_id=s3['access_key_id'],
-        secret_access_key=s3['secret_access_key'],
+        aws_access_key_id=s3['access_key_id'],
+        aws_secret_access_key=s3['secret_access_key'],
     )
 
+    with contextlib.suppress(ClientError):
+        # Perform a cheap request so that the service model is loaded before the first test that uses the client.
+        client.list_buckets()
+
     try:
         yield client
     finally:
         try:
-            client.head_bucket(Bucket=bucket_name)
-        except botocore.exceptions.ClientError:
-            pass
-        else:
-            response = client.list_objects(Bucket=bucket_name)
-            objects = response['Contents'] if 'Contents' in response else ()
-
-            if objects:
-                delete = {'Objects': [{'Key': obj['Key']} for obj in objects]}
-                client.delete_objects(Bucket=bucket_name, Delete=delete)
-
+            empty_bucket(client, bucket_name)
             client.delete_bucket(Bucket=bucket_name)
+        except ClientError as exception:
+            if exception.response['Error']['Code'] != 'NoSuchBucket':
+                raise
 
 
 @pytest.fixture(scope='session')
@@ -180,8 +244,7 @@ def should_mock_aws_s3() -> bool:
 
     :return: Boolean as to whether the AWS S3 client connection should be mocked.
     """
-    default = 'True'
-    return os.getenv('AIIDA_S3_MOCK_AWS_S3', default) == default
+    return MOCK_AWS_S3
 
 
 @pytest.fixture(scope='session')
@@ -189,7 +252,8 @@ def aws_s3_bucket_name(should_mock_aws_s3) -> str:
     """Return the name of the bucket used for this session.
 
     Returns the value defined by the ``AIIDA_S3_AWS_BUCKET_NAME`` environment variable if defined and
-    ``AIIDA_S3_MOCK_AWS_S3`` is set to ``True``, otherwise generates a random name based on :func:`uuid.uuid4`.
+    ``AIIDA_S3_MOCK_AWS_S3`` is set to ``True``, otherwise generates a random name based on :func:`uuid.uuid4`. A name
+    defined by the environment variable is used as is, so it is shared by all ``pytest-xdist`` workers.
 
     :return: Name of the bucket used for this session.
     """
@@ -215,8 +279,8 @@ def aws_s3_config(should_mock_aws_s3) -> dict:
     }
 
 
-@pytest.fixture(scope='session', autouse=True)
-def aws_s3(should_mock_aws_s3, aws_s3_bucket_name, aws_s3_config) -> t.Generator[dict, None, None]:
+@pytest.fixture(scope='session')
+def aws_s3(mock_s3, aws_s3_bucket_name, aws_s3_config) -> dict[str, str]:
     """Return the AWS S3 connection configuration for the session.
 
     The return value is a dictionary with the following keys:
@@ -229,8 +293,8 @@ def aws_s3(should_mock_aws_s3, aws_s3_bucket_name, aws_s3_config) -> t.Generator
     These values are provided by the ``aws_s3_bucket_name`` and ``aws_s3_config`` fixtures, respectively. See their
     documentation how to specify access credentials using environment variables.
 
-    Unless ``AIIDA_S3_MOCK_AWS_S3`` is set to ``True``, the AWS S3 client will be mocked for the entire session using
-    the ``moto`` library.
+    Unless ``AIIDA_S3_MOCK_AWS_S3`` is set to ``True``, the AWS S3 client will be mocked for the entire session through
+    the ``mock_s3`` fixture.
 
     :return: Dictionary with the connection parameters used to connect to AWS S3.
     """
@@ -240,14 +304,11 @@ def aws_s3(should_mock_aws_s3, aws_s3_bucket_name, aws_s3_config) -> t.Generator
         'aws_secret_access_key': aws_s3_config['aws_secret_access_key'],
         'aws_region_name': aws_s3_config['region_name'],
     }
-    context = moto.mock_s3 if should_mock_aws_s3 else contextlib.nullcontext
-
-    with context():
-        yield config
+    return config
 
 
 @pytest.fixture(scope='session')
-def aws_s3_client(aws_s3) -> botocore.client.BaseClient:
+def aws_s3_client(aws_s3, botocore_session) -> botocore.client.BaseClient:
     """Return an AWS S3 client for the session.
 
     A client using ``boto3`` will be initialised if and only if ``AIIDA_S3_MOCK_AWS_S3`` is set to ``True``. Otherwise
@@ -258,30 +319,30 @@ def aws_s3_client(aws_s3) -> botocore.client.BaseClient:
     session. This means that when using this fixture, the cleanup is automatic. Note, however, that if other buckets are
     created, the tests bare the responsibility of cleaning those up themselves.
     """
+    import boto3
+    from botocore.exceptions import ClientError
+
     bucket_name = aws_s3['aws_bucket_name']
-    client = boto3.client(
+    client = boto3.Session(botocore_session=botocore_session).client(
         's3',
         aws_access_key_id=aws_s3['aws_access_key_id'],
         aws_secret_access_key=aws_s3['aws_secret_access_key'],
         region_name=aws_s3['aws_region_name'],
     )
 
+    with contextlib.suppress(ClientError):
+        # Perform a cheap request so that the service model is loaded before the first test that uses the client.
+        client.list_buckets()
+
     try:
         yield client
     finally:
         try:
-            client.head_bucket(Bucket=bucket_name)
-        except botocore.exceptions.ClientError:
-            pass
-        else:
-            response = client.list_objects(Bucket=bucket_name)
-            objects = response['Contents'] if 'Contents' in response else ()
-
-            if objects:
-                delete = {'Objects': [{'Key': obj['Key']} for obj in objects]}
-                client.delete_objects(Bucket=bucket_name, Delete=delete)
-
+            empty_bucket(client, bucket_name)
             client.delete_bucket(Bucket=bucket_name)
+        except ClientError as exception:
+            if exception.response['Error']['Code'] != 'NoSuchBucket':
+                raise
 
 
 @pytest.fixture(scope='session')
@@ -323,19 +384,23 @@ def should_mock_azure_blob() -> bool:
 
     :return: Boolean as to whether the Azure Blob Storage client connection should be mocked.
     """
-    default = 'True'
-    return os.getenv('AIIDA_S3_MOCK_AZURE_BLOB', default) == default
+    return MOCK_AZURE_BLOB
 
 
-@pytest.fixture(autouse=True)
-def skip_if_azure_mocked(request, should_mock_azure_blob):
-    """Skip if connection to Azure Blob storage should be mocked.
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the tests marked with ``skip_if_azure_mocked`` if connection to Azure Blob storage should be mocked.
 
     Currently, it is not yet possible to successfully mock the Azure Blob storage, so the tests can only be run if
     proper credentials to the service are provided.
     """
-    if request.node.get_closest_marker('skip_if_azure_mocked') and should_mock_azure_blob:
-        pytest.skip('skipped because client is mocked')
+    if not MOCK_AZURE_BLOB:
+        return
+
+    skip = pytest.mark.skip(reason='skipped because client is mocked')
+
+    for item in items:
+        if item.get_closest_marker('skip_if_azure_mocked'):
+            item.add_marker(skip)
 
 
 @pytest.fixture(scope='session')
@@ -344,6 +409,7 @@ def azure_blob_container_name(should_mock_azure_blob) -> str:
 
     Returns the value defined by the ``AIIDA_S3_AZURE_BLOB_CONTAINER_NAME`` environment variable if defined and
     ``AIIDA_S3_MOCK_AZURE_BLOB`` is set to ``True``, otherwise generates a random name based on :func:`uuid.uuid4`.
+    A name defined by the environment variable is used as is, so it is shared by all ``pytest-xdist`` workers.
 
     :return: Name of the container used for this session.
     """
@@ -368,12 +434,8 @@ def azure_blob_config(should_mock_azure_blob) -> dict:
     }
 
 
-@pytest.fixture(scope='session', autouse=True)
-def azure_blob_storage(
-    should_mock_azure_blob,
-    azure_blob_container_name,
-    azure_blob_config,
-) -> t.Generator[dict[str, str], None, None]:
+@pytest.fixture(scope='session')
+def azure_blob_storage(azure_blob_container_name, azure_blob_config) -> dict[str, str]:
     """Return the Azure Blob Storage connection configuration for the session.
 
     The return value is a dictionary with the following keys:
@@ -384,19 +446,15 @@ def azure_blob_storage(
     These values are provided by the ``azure_blob_container_name`` and ``azure_blob_config`` fixtures, respectively. See
     their documentation how to specify access credentials using environment variables.
 
-    Unless ``AIIDA_S3_MOCK_AZURE_BLOB`` is set to ``True``, the Azure Blob Service client will be mocked for the entire
-    session using THE WHAT?.
+    The Azure Blob Service client cannot yet be mocked, so if ``AIIDA_S3_MOCK_AZURE_BLOB`` is set to ``True``, the tests
+    that use the service are skipped through the ``skip_if_azure_mocked`` marker.
 
     :return: Dictionary with the connection parameters used to connect to Azure Blob Storage service.
     """
-    config = {
+    return {
         'container_name': azure_blob_container_name,
         'connection_string': azure_blob_config['connection_string'],
     }
-    context = contextlib.nullcontext if should_mock_azure_blob else contextlib.nullcontext
-
-    with context():
-        yield config
 
 
 @pytest.fixture(scope='session')
@@ -429,25 +487,31 @@ def psql_azure_blob_profile(
     azure_blob_storage,
 ) -> t.Generator[Profile, None, None] | None:
     """Return a test profile configured for the :class:`aiida_s3.storage.psql_azure_blob.PsqlAzureBlobStorage`."""
-    from aiida_s3.repository.azure_blob import AzureBlobStorageRepositoryBackend
-
     if should_mock_azure_blob:
         # Azure cannot yet be successfully mocked, so if we are mocking, skip the test.
         yield None
-    else:
-        try:
-            with aiida_profile_factory(
-                aiida_config, storage_backend='s3.psql_azure_blob', storage_config=config_psql_azure_blob()
-            ) as profile:
-                yield profile
-        finally:
-            repository = AzureBlobStorageRepositoryBackend(**azure_blob_storage)
-            repository.erase()
+        return
 
+    from aiida_s3.repository.azure_blob import AzureBlobStorageRepositoryBackend
 
-@pytest.fixture
-def generate_directory(tmp_path: pathlib.Path) -> t.Callable:
-    """Construct a temporary directory with some arbitrary file hierarchy in it."""
+    try:
+        with aiida_profile_factory(
+            aiida_config, storage_backend='s3.psql_azure_blob', storage_config=config_psql_azure_blob()
+        ) as profile:
+            yield profile
+    finally:
+        repository = AzureBlobStorageRepositoryBackend(**azure_blob_storage)
+        repository.erase()
+
+
+@pytest.fixture(scope='session')
+def generate_directory_template(tmp_path_factory: pytest.TempPathFactory) -> t.Callable:
+    """Construct a temporary directory with some arbitrary file hierarchy in it.
+
+    Directories are cached per metadata for the whole session, so the returned directory should not be modified. Use the
+    ``generate_directory`` fixture instead, which returns a copy that is private to the caller.
+    """
+    cache: dict[str, pathlib.Path] = {}
 
     def _factory(metadata: dict | None = None) -> pathlib.Path:
         """Construct the contents of the temporary directory based on the metadata mapping.
@@ -479,21 +543,62 @@ def generate_directory(tmp_path: pathlib.Path) -> t.Callable:
         if metadata is None:
             metadata = {}
 
+        cache_key = json.dumps(metadata, sort_keys=True, default=repr)
+
+        if cache_key in cache:
+            return cache[cache_key]
+
+        tmp_path = tmp_path_factory.mktemp('generate_directory')
+
         def create_files(basepath: pathlib.Path, data: dict):
             """Construct the files in data at the given basepath."""
-            for key, values in data.items():
-                filepath = basepath / key
+            directories: set[pathlib.Path] = set()
+            files: list[tuple[pathlib.Path, bytes]] = []
+            queue = collections.deque([(basepath, data)])
+
+            while queue:
+                dirpath, entries = queue.popleft()
+
+                for key, values in entries.items():
+                    filepath = dirpath / key
 
-                if isinstance(values, dict):
-                    filepath.mkdir(parents=True, exist_ok=True)
-                    create_files(filepath, values)
-                else:
-                    with open(filepath, 'wb') as handle:
-                        if values is not None:
-                            handle.write(values)
+                    if isinstance(values, dict):
+                        directories.add(filepath)
+                        queue.append((filepath, values))
+                    else:
+                        files.append((filepath, values or b''))
+
+            for directory in directories:
+                os.makedirs(directory, exist_ok=True)
+
+            for filepath, content in files:
+                filepath.write_bytes(content)
 
         create_files(tmp_path, metadata)
+        cache[cache_key] = tmp_path
+
+        return tmp_path
+
+    return _factory
 
-        return pathlib.Path(tmp_path)
+
+@pytest.fixture
+def generate_directory(tmp_path_factory: pytest.TempPathFactory, generate_directory_template) -> t.Callable:
+    """Construct a temporary directory with some arbitrary file hierarchy in it.
+
+    The hierarchy is created once per session by ``generate_directory_template`` and each call returns a new copy of it,
+    so tests can modify the returned directory without affecting other calls or tests. See the docstring of that
+    fixture for the format of the metadata.
+    """
+
+    def _factory(metadata: dict | None = None) -> pathlib.Path:
+        """Return a new copy of the temporary directory with the file hierarchy of the metadata mapping.
+
+        :param: file object hierarchy to construct.
+        :return: the path to the temporary directory
+        """
+        directory = tmp_path_factory.mktemp('generate_directory')
+        shutil.copytree(generate_directory_template(metadata), directory, dirs_exist_ok=True)
+        return directory
 
     return _factory
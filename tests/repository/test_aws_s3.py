@@ -1,6 +1,7 @@
 """Tests for the :mod:`aiida_s3.repository.aws_s3` module."""
 
 import io
+import tempfile
 import typing as t
 import uuid
 
@@ -9,18 +10,32 @@ from aiida_s3.repository.aws_s3 import AwsS3RepositoryBackend
 
 
 @pytest.fixture(scope='function')
-def repository_uninitialised(aws_s3_config) -> t.Generator[AwsS3RepositoryBackend, None, None]:
+def repository_uninitialised(aws_s3, aws_s3_config) -> t.Generator[AwsS3RepositoryBackend, None, None]:
     """Return uninitialised instance of :class:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend`."""
     repository = AwsS3RepositoryBackend(bucket_name=str(uuid.uuid4()), **aws_s3_config)
     yield repository
 
 
-@pytest.fixture(scope='function')
-def repository(aws_s3_bucket_name, aws_s3_config) -> t.Generator[AwsS3RepositoryBackend, None, None]:
-    """Return initialised instance of :class:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend`."""
+@pytest.fixture(scope='module')
+def repository_module(aws_s3, aws_s3_bucket_name, aws_s3_config) -> t.Generator[AwsS3RepositoryBackend, None, None]:
+    """Return initialised instance of :class:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend`.
+
+    The instance, and so its bucket, is shared by all tests of the module.
+    """
     repository = AwsS3RepositoryBackend(bucket_name=aws_s3_bucket_name, **aws_s3_config)
     repository.initialise()
     yield repository
+    repository.erase()
+
+
+@pytest.fixture(scope='function')
+def repository(repository_module) -> AwsS3RepositoryBackend:
+    """Return initialised instance of :class:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend`.
+
+    The instance is shared by all tests of the module and is only initialised again if a previous test erased it.
+    """
+    repository_module.initialise()
+    return repository_module
 
 
 def test_initialise(repository_uninitialised):
@@ -46,12 +61,9 @@ def test_key_format(repository):
     assert repository.key_format == 'uuid4'
 
 
-def test_erase(repository, generate_directory):
+def test_erase(repository):
     """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.erase` method."""
-    directory = generate_directory({'file_a': None})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_object(key)
 
@@ -86,26 +98,21 @@ def test_put_object_from_filelike_raises(repository, generate_directory):
             repository.put_object_from_filelike(handle)  # Not in binary mode
 
 
-def test_put_object_from_filelike(repository, generate_directory):
+def test_put_object_from_filelike(repository):
     """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.put_object_from_filelike` method."""
-    directory = generate_directory({'file_a': None})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert isinstance(key, str)
 
 
-def test_has_objects(repository, generate_directory):
+def test_has_objects(repository):
     """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.has_objects` method."""
-    directory = generate_directory({'file_a': None})
-
     assert repository.has_objects(['non_existant']) == [False]
 
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_objects([key]) == [True]
+    assert repository.has_objects([key, 'non_existant', key]) == [True, False, True]
 
 
 def test_open_raise(repository):
@@ -118,20 +125,13 @@ def test_open_raise(repository):
             pass
 
 
-def test_open(repository, generate_directory):
+def test_open(repository):
     """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.open` method."""
-    directory = generate_directory({'file_a': b'content_a', 'relative': {'file_b': b'content_b'}})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key_a = repository.put_object_from_filelike(handle)
-
-    with open(directory / 'relative/file_b', 'rb') as handle:
-        key_b = repository.put_object_from_filelike(handle)
-
-    with repository.open(key_a) as handle:
-        assert isinstance(handle, io.BufferedRandom)
+    key_a = repository.put_object_from_filelike(io.BytesIO(b'content_a'))
+    key_b = repository.put_object_from_filelike(io.BytesIO(b'content_b'))
 
     with repository.open(key_a) as handle:
+        assert isinstance(handle, tempfile.SpooledTemporaryFile)
         assert handle.read() == b'content_a'
 
     with repository.open(key_b) as handle:
@@ -146,50 +146,51 @@ def test_iter_object_streams(repository):
         assert _key == key
         assert stream.read() == b'content'
 
+    # Objects are downloaded concurrently, but should be yielded in the order of the keys.
+    contents = {repository.put_object_from_filelike(io.BytesIO(f'{i}'.encode())): f'{i}'.encode() for i in range(20)}
+    streamed = [(_key, stream.read()) for _key, stream in repository.iter_object_streams(list(contents))]
+    assert streamed == list(contents.items())
+
+    with pytest.raises(FileNotFoundError):
+        for _ in repository.iter_object_streams([key, 'non_existant']):
+            pass
 
-def test_delete_objects(repository, generate_directory):
-    """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.delete_objects` method."""
-    directory = generate_directory({'file_a': None})
 
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+def test_delete_objects(repository):
+    """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.delete_objects` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_object(key)
 
     repository.delete_objects([key])
     assert not repository.has_object(key)
 
+    # The existence of multiple keys is checked concurrently with a single call.
+    keys = [repository.put_object_from_filelike(io.BytesIO(b'content')) for _ in range(3)]
+    assert repository.has_objects(keys) == [True, True, True]
+
+    repository.delete_objects(keys)
+    assert repository.has_objects(keys) == [False, False, False]
+
     # The call should not except when an empty list of keys is provided.
     assert repository.delete_objects([]) is None
 
 
-def test_get_object_hash(repository, generate_directory):
+def test_get_object_hash(repository):
     """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.get_object_hash` method."""
-    directory = generate_directory({'file_a': b'content'})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
 
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
-def test_list_objects(repository, generate_directory):
+def test_list_objects(repository):
     """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.list_objects` method."""
-    keys = []
-
-    # First empty the repository because other tests may have added objects to it.
-    repository.erase()
-    repository.initialise()
-
-    directory = generate_directory({'file_a': b'content a', 'file_b': b'content b'})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        keys.append(repository.put_object_from_filelike(handle))
+    # Other tests may have added objects to the repository, so only the objects added by this test are compared.
+    baseline = set(repository.list_objects())
 
-    with open(directory / 'file_b', 'rb') as handle:
-        keys.append(repository.put_object_from_filelike(handle))
+    keys = [repository.put_object_from_filelike(io.BytesIO(content)) for content in (b'content a', b'content b')]
 
-    assert sorted(list(repository.list_objects())) == sorted(keys)
+    assert set(repository.list_objects()) - baseline == set(keys)
 
 
 def test_get_info(repository):
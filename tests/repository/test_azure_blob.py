@@ -1,11 +1,13 @@
 """Tests for the :mod:`aiida_s3.repository.azure_blob` module."""
 
 import io
+import tempfile
 import typing as t
 import uuid
 
 import pytest
 from aiida_s3.repository.azure_blob import AzureBlobStorageRepositoryBackend
+from azure.core.exceptions import HttpResponseError
 
 pytestmark = pytest.mark.skip_if_azure_mocked
 
@@ -20,9 +22,12 @@ def repository_uninitialised(azure_blob_config) -> t.Generator[AzureBlobStorageR
         repository.erase()
 
 
-@pytest.fixture(scope='function')
-def repository(azure_blob_config) -> t.Generator[AzureBlobStorageRepositoryBackend, None, None]:
-    """Return initialised instance of :class:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend`."""
+@pytest.fixture(scope='module')
+def repository_module(azure_blob_config) -> t.Generator[AzureBlobStorageRepositoryBackend, None, None]:
+    """Return initialised instance of :class:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend`.
+
+    The instance, and so its container, is shared by all tests of the module.
+    """
     repository = AzureBlobStorageRepositoryBackend(str(uuid.uuid4()), **azure_blob_config)
     repository.initialise()
     try:
@@ -31,6 +36,16 @@ def repository(azure_blob_config) -> t.Generator[AzureBlobStorageRepositoryBacke
         repository.erase()
 
 
+@pytest.fixture(scope='function')
+def repository(repository_module) -> AzureBlobStorageRepositoryBackend:
+    """Return initialised instance of :class:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend`.
+
+    The instance is shared by all tests of the module and is only initialised again if a previous test erased it.
+    """
+    repository_module.initialise()
+    return repository_module
+
+
 def test_initialise(repository_uninitialised):
     """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.initialise` method."""
     repository = repository_uninitialised
@@ -54,12 +69,9 @@ def test_key_format(repository):
     assert repository.key_format == 'uuid4'
 
 
-def test_erase(repository, generate_directory):
+def test_erase(repository):
     """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.erase` method."""
-    directory = generate_directory({'file_a': None})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_object(key)
 
@@ -94,26 +106,21 @@ def test_put_object_from_filelike_raises(repository, generate_directory):
             repository.put_object_from_filelike(handle)  # Not in binary mode
 
 
-def test_put_object_from_filelike(repository, generate_directory):
+def test_put_object_from_filelike(repository):
     """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.put_object_from_filelike` method."""
-    directory = generate_directory({'file_a': None})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert isinstance(key, str)
 
 
-def test_has_objects(repository, generate_directory):
+def test_has_objects(repository):
     """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.has_objects` method."""
-    directory = generate_directory({'file_a': None})
-
     assert repository.has_objects(['non_existant']) == [False]
 
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_objects([key]) == [True]
+    assert repository.has_objects([key, 'non_existant', key]) == [True, False, True]
 
 
 def test_open_raise(repository):
@@ -126,20 +133,13 @@ def test_open_raise(repository):
             pass
 
 
-def test_open(repository, generate_directory):
+def test_open(repository):
     """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.open` method."""
-    directory = generate_directory({'file_a': b'content_a', 'relative': {'file_b': b'content_b'}})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key_a = repository.put_object_from_filelike(handle)
-
-    with open(directory / 'relative/file_b', 'rb') as handle:
-        key_b = repository.put_object_from_filelike(handle)
-
-    with repository.open(key_a) as handle:
-        assert isinstance(handle, io.BufferedRandom)
+    key_a = repository.put_object_from_filelike(io.BytesIO(b'content_a'))
+    key_b = repository.put_object_from_filelike(io.BytesIO(b'content_b'))
 
     with repository.open(key_a) as handle:
+        assert isinstance(handle, tempfile.SpooledTemporaryFile)
         assert handle.read() == b'content_a'
 
     with repository.open(key_b) as handle:
@@ -154,50 +154,102 @@ def test_iter_object_streams(repository):
         assert _key == key
         assert stream.read() == b'content'
 
+    # Objects are downloaded concurrently, but should be yielded in the order of the keys.
+    contents = {repository.put_object_from_filelike(io.BytesIO(f'{i}'.encode())): f'{i}'.encode() for i in range(20)}
+    streamed = [(_key, stream.read()) for _key, stream in repository.iter_object_streams(list(contents))]
+    assert streamed == list(contents.items())
 
-def test_delete_objects(repository, generate_directory):
-    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.delete_objects` method."""
-    directory = generate_directory({'file_a': None})
+    with pytest.raises(FileNotFoundError):
+        for _ in repository.iter_object_streams([key, 'non_existant']):
+            pass
 
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+
+def test_delete_objects(repository):
+    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.delete_objects` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_object(key)
 
     repository.delete_objects([key])
     assert not repository.has_object(key)
 
+    # The existence of multiple keys is checked concurrently with a single call.
+    keys = [repository.put_object_from_filelike(io.BytesIO(b'content')) for _ in range(3)]
+    assert repository.has_objects(keys) == [True, True, True]
+
+    repository.delete_objects(keys)
+    assert repository.has_objects(keys) == [False, False, False]
+
     # The call should not except when an empty list of keys is provided.
     assert repository.delete_objects([]) is None
 
 
-def test_get_object_hash(repository, generate_directory):
-    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.get_object_hash` method."""
-    directory = generate_directory({'file_a': b'content'})
+def test_delete_objects_generator(repository):
+    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.delete_objects` for a generator.
 
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    The keys are used both to check that the objects exist and to delete them, so all objects should be deleted even if
+    the keys can only be iterated over once.
+    """
+    keys = [repository.put_object_from_filelike(io.BytesIO(b'content')) for _ in range(3)]
+    repository.delete_objects(key for key in keys)
+    assert repository.has_objects(keys) == [False] * len(keys)
 
-    assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
+def test_delete_objects_batch_size(repository, monkeypatch):
+    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.delete_objects` for many batches.
 
-def test_list_objects(repository, generate_directory):
-    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.list_objects` method."""
-    keys = []
+    If more keys are deleted than ``delete_objects_batch_size``, they are deleted with multiple requests.
+    """
+    keys = [repository.put_object_from_filelike(io.BytesIO(b'content')) for _ in range(5)]
+    monkeypatch.setattr(repository, 'delete_objects_batch_size', 2)
+    repository.delete_objects(keys)
+    assert repository.has_objects(keys) == [False] * len(keys)
 
-    # First empty the repository because other tests may have added objects to it.
-    repository.delete_objects(repository.list_objects())
-    repository.initialise()
 
-    directory = generate_directory({'file_a': b'content a', 'file_b': b'content b'})
+def test_delete_objects_batch_raises(repository, monkeypatch):
+    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.delete_objects` for a failed batch.
+
+    An ``HttpResponseError`` raised by any of the batch requests should be converted into an ``OSError``.
+    """
+    keys = [repository.put_object_from_filelike(io.BytesIO(b'content')) for _ in range(5)]
+    delete_blobs = repository._container_client.delete_blobs
+
+    def delete_blobs_failing_last_batch(*blobs):
+        if len(blobs) == 1:
+            raise HttpResponseError('batch failed')
+        return delete_blobs(*blobs)
+
+    monkeypatch.setattr(repository, 'delete_objects_batch_size', 2)
+    monkeypatch.setattr(repository._container_client, 'delete_blobs', delete_blobs_failing_last_batch)
+
+    with pytest.raises(OSError, match='some of the objects could not be deleted'):
+        repository.delete_objects(keys)
 
-    with open(directory / 'file_a', 'rb') as handle:
-        keys.append(repository.put_object_from_filelike(handle))
 
-    with open(directory / 'file_b', 'rb') as handle:
-        keys.append(repository.put_object_from_filelike(handle))
+def test_delete_all_objects(repository):
+    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.delete_all_objects` method."""
+    repository.put_object_from_filelike(io.BytesIO(b'content'))
+
+    repository.delete_all_objects()
+    assert not list(repository.list_objects())
+    assert repository.is_initialised
+
+
+def test_get_object_hash(repository):
+    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.get_object_hash` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+
+    assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
+
+
+def test_list_objects(repository):
+    """Test :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.list_objects` method."""
+    # Other tests may have added objects to the repository, so only the objects added by this test are compared.
+    baseline = set(repository.list_objects())
+
+    keys = [repository.put_object_from_filelike(io.BytesIO(content)) for content in (b'content a', b'content b')]
 
-    assert sorted(list(repository.list_objects())) == sorted(keys)
+    assert set(repository.list_objects()) - baseline == set(keys)
 
 
 def test_get_info(repository):
@@ -1,6 +1,8 @@
 """Tests for the :mod:`aiida_s3.repository.s3` module."""
 
+import concurrent.futures
 import io
+import tempfile
 import typing as t
 import uuid
 
@@ -9,18 +11,32 @@ from aiida_s3.repository.s3 import S3RepositoryBackend
 
 
 @pytest.fixture(scope='function')
-def repository_uninitialised(s3_config) -> t.Generator[S3RepositoryBackend, None, None]:
+def repository_uninitialised(s3, s3_config) -> t.Generator[S3RepositoryBackend, None, None]:
     """Return uninitialised instance of :class:`aiida_s3.repository.s3.S3RepositoryBackend`."""
     repository = S3RepositoryBackend(bucket_name=str(uuid.uuid4()), **s3_config)
     yield repository
 
 
-@pytest.fixture(scope='function')
-def repository(s3_bucket_name, s3_config) -> t.Generator[S3RepositoryBackend, None, None]:
-    """Return initialised instance of :class:`aiida_s3.repository.s3.S3RepositoryBackend`."""
+@pytest.fixture(scope='module')
+def repository_module(s3, s3_bucket_name, s3_config) -> t.Generator[S3RepositoryBackend, None, None]:
+    """Return initialised instance of :class:`aiida_s3.repository.s3.S3RepositoryBackend`.
+
+    The instance, and so its bucket, is shared by all tests of the module.
+    """
     repository = S3RepositoryBackend(bucket_name=s3_bucket_name, **s3_config)
     repository.initialise()
     yield repository
+    repository.erase()
+
+
+@pytest.fixture(scope='function')
+def repository(repository_module) -> S3RepositoryBackend:
+    """Return initialised instance of :class:`aiida_s3.repository.s3.S3RepositoryBackend`.
+
+    The instance is shared by all tests of the module and is only initialised again if a previous test erased it.
+    """
+    repository_module.initialise()
+    return repository_module
 
 
 def test_initialise(repository_uninitialised):
@@ -46,12 +62,9 @@ def test_key_format(repository):
     assert repository.key_format == 'uuid4'
 
 
-def test_erase(repository, generate_directory):
+def test_erase(repository):
     """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.erase` method."""
-    directory = generate_directory({'file_a': None})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_object(key)
 
@@ -86,26 +99,53 @@ def test_put_object_from_filelike_raises(repository, generate_directory):
             repository.put_object_from_filelike(handle)  # Not in binary mode
 
 
-def test_put_object_from_filelike(repository, generate_directory):
+def test_put_object_from_filelike(repository):
     """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.put_object_from_filelike` method."""
-    directory = generate_directory({'file_a': None})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert isinstance(key, str)
 
 
-def test_has_objects(repository, generate_directory):
-    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.has_objects` method."""
-    directory = generate_directory({'file_a': None})
+def test_put_object_from_filelike_unseekable(repository):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.put_object_from_filelike` method.
+
+    A stream that only defines ``read`` and ``mode`` is a valid byte stream, but its size cannot be determined, so it
+    should be uploaded through a managed transfer.
+    """
 
+    class Stream:
+        mode = 'rb'
+
+        def __init__(self, content: bytes):
+            self._handle = io.BytesIO(content)
+
+        def read(self, size: int = -1) -> bytes:
+            return self._handle.read(size)
+
+    key = repository.put_object_from_filelike(Stream(b'content'))
+
+    with repository.open(key) as handle:
+        assert handle.read() == b'content'
+
+
+def test_has_objects(repository):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.has_objects` method."""
     assert repository.has_objects(['non_existant']) == [False]
 
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_objects([key]) == [True]
+    assert repository.has_objects([key, 'non_existant', key]) == [True, False, True]
+
+
+def test_has_objects_list_threshold(repository, monkeypatch):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.has_objects` method when listing the bucket.
+
+    If more keys are requested than ``has_objects_list_threshold``, the bucket is listed instead.
+    """
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+    monkeypatch.setattr(repository, 'has_objects_list_threshold', 1)
+    assert repository.has_objects([key, 'non_existant']) == [True, False]
 
 
 def test_open_raise(repository):
@@ -118,26 +158,56 @@ def test_open_raise(repository):
             pass
 
 
-def test_open(repository, generate_directory):
+def test_open(repository):
     """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.open` method."""
-    directory = generate_directory({'file_a': b'content_a', 'relative': {'file_b': b'content_b'}})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key_a = repository.put_object_from_filelike(handle)
-
-    with open(directory / 'relative/file_b', 'rb') as handle:
-        key_b = repository.put_object_from_filelike(handle)
-
-    with repository.open(key_a) as handle:
-        assert isinstance(handle, io.BufferedRandom)
+    key_a = repository.put_object_from_filelike(io.BytesIO(b'content_a'))
+    key_b = repository.put_object_from_filelike(io.BytesIO(b'content_b'))
 
     with repository.open(key_a) as handle:
+        assert isinstance(handle, tempfile.SpooledTemporaryFile)
         assert handle.read() == b'content_a'
 
     with repository.open(key_b) as handle:
         assert handle.read() == b'content_b'
 
 
+def test_open_empty(repository):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.open` method for an empty object."""
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
+
+    with repository.open(key) as handle:
+        assert handle.read() == b''
+
+
+def test_open_multipart(repository, monkeypatch):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.open` method for objects downloaded in parts.
+
+    If the object is larger than ``multipart_threshold``, the remaining bytes after the first request are downloaded
+    in byte ranges that are requested concurrently and that should be written to the handle in the correct order.
+    """
+    content = b''.join(f'{i:04}'.encode() for i in range(64))
+    key = repository.put_object_from_filelike(io.BytesIO(content))
+
+    monkeypatch.setattr(repository, 'multipart_threshold', 64)
+    monkeypatch.setattr(repository, 'multipart_chunksize', 16)
+
+    operations = []
+
+    def record(model, **kwargs):
+        operations.append(model.name)
+
+    repository._client.meta.events.register('before-call.s3', record)
+
+    try:
+        with repository.open(key) as handle:
+            assert handle.read() == content
+    finally:
+        repository._client.meta.events.unregister('before-call.s3', record)
+
+    # The first request fetches ``multipart_threshold`` bytes, and the remaining 192 bytes are fetched in 12 ranges.
+    assert operations == ['GetObject'] * 13
+
+
 def test_iter_object_streams(repository):
     """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.iter_object_streams` method."""
     key = repository.put_object_from_filelike(io.BytesIO(b'content'))
@@ -146,50 +216,62 @@ def test_iter_object_streams(repository):
         assert _key == key
         assert stream.read() == b'content'
 
+    # Objects are downloaded concurrently, but should be yielded in the order of the keys.
+    contents = {repository.put_object_from_filelike(io.BytesIO(f'{i}'.encode())): f'{i}'.encode() for i in range(20)}
+    streamed = [(_key, stream.read()) for _key, stream in repository.iter_object_streams(list(contents))]
+    assert streamed == list(contents.items())
 
-def test_delete_objects(repository, generate_directory):
-    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.delete_objects` method."""
-    directory = generate_directory({'file_a': None})
+    with pytest.raises(FileNotFoundError):
+        for _ in repository.iter_object_streams([key, 'non_existant']):
+            pass
 
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+
+def test_delete_objects(repository):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.delete_objects` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b''))
 
     assert repository.has_object(key)
 
     repository.delete_objects([key])
     assert not repository.has_object(key)
 
+    # The existence of multiple keys is checked concurrently with a single call.
+    keys = [repository.put_object_from_filelike(io.BytesIO(b'content')) for _ in range(3)]
+    assert repository.has_objects(keys) == [True, True, True]
+
+    repository.delete_objects(keys)
+    assert repository.has_objects(keys) == [False, False, False]
+
     # The call should not except when an empty list of keys is provided.
     assert repository.delete_objects([]) is None
 
 
-def test_get_object_hash(repository, generate_directory):
-    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.get_object_hash` method."""
-    directory = generate_directory({'file_a': b'content'})
-
-    with open(directory / 'file_a', 'rb') as handle:
-        key = repository.put_object_from_filelike(handle)
+def test_delete_objects_batch_size(repository, monkeypatch):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.delete_objects` method for multiple batches.
 
-    assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
+    If more keys are deleted than ``delete_objects_batch_size``, they are deleted with multiple requests.
+    """
+    keys = [repository.put_object_from_filelike(io.BytesIO(b'content')) for _ in range(5)]
+    monkeypatch.setattr(repository, 'delete_objects_batch_size', 2)
+    repository.delete_objects(keys)
+    assert repository.has_objects(keys) == [False] * len(keys)
 
 
-def test_list_objects(repository, generate_directory):
-    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.list_objects` method."""
-    keys = []
+def test_get_object_hash(repository):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.get_object_hash` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
 
-    # First empty the repository because other tests may have added objects to it.
-    repository.erase()
-    repository.initialise()
+    assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
-    directory = generate_directory({'file_a': b'content a', 'file_b': b'content b'})
 
-    with open(directory / 'file_a', 'rb') as handle:
-        keys.append(repository.put_object_from_filelike(handle))
+def test_list_objects(repository):
+    """Test the :meth:`aiida_s3.repository.s3.S3RepositoryBackend.list_objects` method."""
+    # Other tests may have added objects to the repository, so only the objects added by this test are compared.
+    baseline = set(repository.list_objects())
 
-    with open(directory / 'file_b', 'rb') as handle:
-        keys.append(repository.put_object_from_filelike(handle))
+    keys = [repository.put_object_from_filelike(io.BytesIO(content)) for content in (b'content a', b'content b')]
 
-    assert sorted(list(repository.list_objects())) == sorted(keys)
+    assert set(repository.list_objects()) - baseline == set(keys)
 
 
 def test_list_objects_empty(repository):
@@ -207,17 +289,18 @@ def test_list_objects_many(repository):
     default page size is a 1000, so here we test creating a repo with more than a 1000 and check that ``list_objects``
     returns all of them.
     """
-    keys = []
-
     # First empty the repository because other tests may have added objects to it.
     repository.erase()
     repository.initialise()
 
-    # Create more than 1000 objects to ensure there are at least two pages of results.
-    for _ in range(1010):
-        keys.append(repository.put_object_from_filelike(io.BytesIO(b'a')))
+    # Create more than 1000 objects to ensure there are at least two pages of results. The uploads are independent, so
+    # they are sent concurrently, reusing the connection pool of the client.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=repository.max_workers) as executor:
+        keys = list(executor.map(lambda _: repository.put_object_from_filelike(io.BytesIO(b'a')), range(1010)))
 
-    assert sorted(list(repository.list_objects())) == sorted(keys)
+    listed = list(repository.list_objects())
+    assert len(listed) == len(keys)
+    assert set(listed) == set(keys)
 
 
 def test_get_info(repository):
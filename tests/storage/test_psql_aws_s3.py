@@ -12,6 +12,28 @@ def test_get_repository(psql_aws_s3_profile):
     """Test the :meth:`aiida_s3.repository.aws_s3.AwsS3RepositoryBackend.get_repository` method."""
     storage = PsqlAwsS3Storage(psql_aws_s3_profile)
     assert isinstance(storage.get_repository(), AwsS3RepositoryBackend)
+    assert storage.get_repository() is storage.get_repository()
+
+
+def test_clear_discards_repository(psql_aws_s3_profile, monkeypatch):
+    """Test that clearing the storage discards the cached repository.
+
+    The migrator erases the bucket through its own instance. If it is not initialised again, the repository returned by
+    the storage should no longer report that it is initialised. Clearing also deletes the default user, so the storage
+    of the session profile is reset afterwards.
+    """
+    storage = PsqlAwsS3Storage(psql_aws_s3_profile)
+    assert storage.get_repository().is_initialised
+
+    monkeypatch.setattr(storage.migrator, 'initialise_repository', lambda self: None)
+
+    try:
+        storage._clear()
+        assert not storage.get_repository().is_initialised
+    finally:
+        storage.close()
+        monkeypatch.undo()
+        psql_aws_s3_profile.reset_storage()
 
 
 @pytest.mark.usefixtures('psql_aws_s3_profile')
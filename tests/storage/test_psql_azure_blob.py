@@ -14,6 +14,27 @@ def test_get_repository(psql_azure_blob_profile):
     """Test the :meth:`aiida_s3.repository.azure_blob.AzureBlobStorageRepositoryBackend.get_repository` method."""
     storage = PsqlAzureBlobStorage(psql_azure_blob_profile)
     assert isinstance(storage.get_repository(), AzureBlobStorageRepositoryBackend)
+    assert storage.get_repository() is storage.get_repository()
+
+
+def test_clear_discards_repository(psql_azure_blob_profile):
+    """Test that clearing the storage discards the cached repository.
+
+    The migrator deletes all objects through its own instance but keeps the container. The repository returned by the
+    storage should be a new instance that no longer holds any objects. Clearing also deletes the default user, so the
+    storage of the session profile is reset afterwards.
+    """
+    storage = PsqlAzureBlobStorage(psql_azure_blob_profile)
+    repository = storage.get_repository()
+    repository.put_object_from_filelike(io.BytesIO(b'content'))
+
+    try:
+        storage._clear()
+        assert storage.get_repository() is not repository
+        assert not list(storage.get_repository().list_objects())
+    finally:
+        storage.close()
+        psql_azure_blob_profile.reset_storage()
 
 
 @pytest.mark.usefixtures('psql_azure_blob_profile')
@@ -7,3 +7,16 @@ def test_s3_client(aws_s3_client, aws_s3_config):
     """Test the ``aws_s3_client`` fixture."""
     assert isinstance(aws_s3_client, BaseClient)
     assert str(aws_s3_client._endpoint) == f's3(https://s3.{aws_s3_config["region_name"]}.amazonaws.com)'
+
+
+def test_generate_directory(generate_directory):
+    """Test that each call of the ``generate_directory`` fixture returns a separate copy of the directory."""
+    metadata = {'relative': {'empty_folder': {}, 'filename': b'content'}}
+    directory_a = generate_directory(metadata)
+    directory_b = generate_directory(metadata)
+
+    assert directory_a != directory_b
+    assert (directory_b / 'relative' / 'empty_folder').is_dir()
+
+    (directory_a / 'relative' / 'filename').write_bytes(b'changed')
+    assert (directory_b / 'relative' / 'filename').read_bytes() == b'content'